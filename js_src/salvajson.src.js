@@ -1,10 +1,47 @@
 let { Jsonic } = require("jsonic");
 
-let reparse = (s) => {
+// Named repair profiles, mapped to Jsonic.make() options.
+// "lenient" is the stock Jsonic instance with every leniency feature on.
+// "strict" keeps the repairs we rely on (unquoted keys/values, single quotes,
+// trailing or missing commas, comments) but drops exotic number formats
+// (hex/octal/binary, "_" separators) and "{a:b:1}" path-dive keys.
+const PROFILES = {
+  lenient: null,
+  strict: {
+    number: { hex: false, oct: false, bin: false, sep: null },
+    rule: { exclude: "path" },
+  },
+};
+
+const DEFAULT_PROFILE = "lenient";
+
+// Configured parsers, keyed by profile name or JSON-encoded custom options,
+// so each Jsonic.make() grammar is only built once per process.
+const parsers = new Map();
+
+let getParser = (profile) => {
+  let key = profile == null ? DEFAULT_PROFILE : profile;
+  let parser = parsers.get(key);
+  if (parser === undefined) {
+    let options;
+    if (Object.prototype.hasOwnProperty.call(PROFILES, key)) {
+      options = PROFILES[key];
+    } else if (key.startsWith("{")) {
+      options = JSON.parse(key);
+    } else {
+      throw new Error(`salvajson: unknown repair profile: ${key}`);
+    }
+    parser = options === null ? Jsonic : Jsonic.make(options);
+    parsers.set(key, parser);
+  }
+  return parser;
+};
+
+let reparse = (s, profile) => {
   try {
     // Ensure Jsonic output is an object/array before stringifying,
     // as Jsonic can return primitive types for certain inputs (e.g. "123").
-    const parsed = Jsonic(s);
+    const parsed = getParser(profile)(s);
     // Check if Jsonic itself failed and returned an error object
     // (Jsonic's own error handling can be a bit peculiar depending on options)
     if (parsed instanceof Error) {
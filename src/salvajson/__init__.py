@@ -6,9 +6,10 @@ PythonMonkey to leverage jsonic's flexible parsing capabilities.
 
 The package provides three main functions:
 
-    salvaj(json_str: str) -> str
+    salvaj(json_str: str, profile="lenient") -> str
         Parse potentially corrupted JSON strings using jsonic and return
-        valid JSON.
+        valid JSON. The profile ("lenient", "strict" or a dict of
+        Jsonic.make() options) selects a cached, configured parser.
 
     dumps(obj, *, indent=None, sort_keys=False, **kw) -> str
         Serialize Python objects to JSON strings using orjson for high
@@ -7,16 +7,17 @@ from fire import Fire  # type: ignore
 from . import salvaj
 
 
-def cli(path: str | Path) -> str:
+def cli(path: str | Path, profile: str = "lenient") -> str:
     """Parse potentially corrupted JSON file using jsonic.
 
     Args:
         path: Path to the JSON file to parse
+        profile: Repair profile name ("lenient" or "strict")
 
     Returns:
         Fixed JSON string that can be parsed by standard JSON parsers
     """
-    return salvaj(Path(path).read_text())
+    return salvaj(Path(path).read_text(), profile)
 
 
 if __name__ == "__main__":
@@ -61,4 +61,4 @@ OCTET  = %x00-FF
 SP     = %x20
 VCHAR  = %x21-7E
 WSP    = SP / HTAB
-`,Ie=null;function Pn(){if(Ie)return Ie;let n=Mt()(An);for(let t of n)t.nodeKind="core";return Ie=new Map(n.map(t=>[t.name,t])),Ie}function Ve(e,n){for(let t of e)if(t.kind==="ref")n.add(t.name);else if(t.kind==="opt"||t.kind==="star"||t.kind==="plus"||t.kind==="rep")Ve([t.inner],n);else if(t.kind==="group")for(let r of t.alts)Ve(r,n)}function Rn(e){let n=Pn(),t=new Set(e.map(u=>u.name)),r=new Set,l=u=>{for(let f of u)for(let a of f.alts)Ve(a,r)};l(e);let i=[],s=!0;for(;s;){s=!1;for(let[u,f]of n)t.has(u)||r.has(u)&&(t.add(u),i.push(f),l([f]),s=!0)}return[...e,...i]}function $n(e){let n=[],t=new Map;for(let r of e){if(r.incremental){let i=t.get(r.name);if(!i)throw new oe(`bnf: '${r.name} =/ \u2026' has no earlier '${r.name} = \u2026' to extend`);i.alts.push(...r.alts);continue}let l={name:r.name,alts:r.alts};r.nodeKind&&(l.nodeKind=r.nodeKind),n.push(l),t.set(r.name,l)}return n}function Ln(e){if(e.kind!=="opt")return null;let n=e.inner;if(n.kind!=="group"||n.alts.length!==1)return null;let t=n.alts[0];if(t.length<2)return null;let r=t[t.length-1];return r.kind!=="term"&&r.kind!=="regex"?null:{xSeq:t.slice(0,-1),disambiguator:r}}function Me(e,n,t,r){if(e.kind==="term"){let l=D(e);t.has(l)||t.set(l,e);return}if(e.kind==="regex"){let l=Z(e);t.has(l)||t.set(l,e);return}if(e.kind==="ref"){if(r.has(e.name))return;r.add(e.name);let l=n.productions.find(i=>i.name===e.name);if(!l)return;for(let i of l.alts)for(let s of i)Me(s,n,t,r);return}if(e.kind==="opt"||e.kind==="star"||e.kind==="plus"||e.kind==="rep"){Me(e.inner,n,t,r);return}if(e.kind==="group"){for(let l of e.alts)for(let i of l)Me(i,n,t,r);return}}function Et(e,n){let t=new Map,r=new Set;for(let l of e)Me(l,n,t,r);return t}function Kn(e,n){for(let t of e.keys())if(n.has(t))return!0;return!1}function Fn(e){let n=e.ambiguities??[],t=[],r=new Set(e.productions.map(s=>s.name));function l(s){let u=s,f=1;for(;r.has(u);)u=s+f,f++;return r.add(u),u}let i=[];for(let s of e.productions){let u=[],f=!1;for(let a=0;a<s.alts.length;a++){let c=s.alts[a],o=[];for(let d=0;d<c.length;d++){let g=c[d],h=Ln(g);if(!h){o.push(g);continue}let m=c.slice(d+1);if(m.length===0){o.push(g);continue}let p=Et(h.xSeq,e),k=Et(m,e);if(!Kn(p,k)){o.push(g);continue}let b=new Map([...p,...k]),S=h.disambiguator,y=S.kind==="term"?D(S):S.kind==="regex"?Z(S):null;y&&b.delete(y);let x=l(`${s.name}$pd${d}`),N=l(`${x}$probe`),B=l(`${x}$with`),A=l(`${x}$no`);t.push({name:N,alts:[],probeHelper:{vocabElements:[...b.values()]},nodeKind:"helper"}),t.push({name:B,alts:[[...h.xSeq,h.disambiguator,...m]],nodeKind:"helper"}),t.push({name:A,alts:[m],nodeKind:"helper"}),t.push({name:x,alts:[[{kind:"ref",name:B}],[{kind:"ref",name:A}]],probeDispatch:{probeRule:N,disambiguator:h.disambiguator,withBranch:B,noBranch:A},nodeKind:"helper"}),n.push({rule:s.name,altIdx:a,optIdx:d,reason:"optional prefix shares vocabulary with tail",resolved:!0}),o.push({kind:"ref",name:x}),d=c.length,f=!0}u.push(o)}f?i.push({name:s.name,alts:u,nodeKind:s.nodeKind}):i.push(s)}return{productions:[...i,...t],ambiguities:n}}function Bn(e,n,t,r,l){let i=e.probeHelper.vocabElements,s=[];for(let u of i){let f=u.kind==="term"?r.get(D(u)):u.kind==="regex"?l.get(Z(u)):void 0;f&&s.push({s:f,r:e.name,g:n})}s.push({g:n}),t[e.name]={open:s}}function qn(e,n,t,r,l,i){let{probeRule:s,disambiguator:u,withBranch:f,noBranch:a}=e.probeDispatch,c=u.kind==="term"?l.get(D(u)):u.kind==="regex"?i.get(Z(u)):void 0;if(!c)throw new Error(`bnf: probe-dispatch rule '${e.name}' has unresolvable disambiguator (kind=${u.kind})`);let o=r.register((h,m)=>{h.k.pd_phase=0,h.k.pd_mark=m.mark()}),d=r.register((h,m)=>{let p=m.t[0];m.rewind(h.k.pd_mark);let k=p&&p.name===c;h.k.pd_phase=k?1:2}),g=r.register(h=>{h.child&&h.child.node!==void 0&&(h.node=h.child.node)});t[e.name]={open:[{c:r.register(h=>!h.k.pd_phase),a:o,p:s,g:n},{c:r.register(h=>h.k.pd_phase===1),p:f,g:n},{c:r.register(h=>h.k.pd_phase===2),p:a,g:n}],close:[{c:r.register(h=>h.k.pd_phase===0),a:d,r:e.name,g:n},{a:g,g:n}]}}function Nt(e,n){let t=n?.start??e.productions[0].name,r=n?.tag??"bnf";e=Tt(e),e=Fn(e),e=Nn(e);let l=new Map,i=new Map,s=new Set,u={},f={};for(let k of e.productions){for(let b of k.alts)for(let S of b)if(S.kind==="term"){let y=D(S);if(!l.has(y)){let x=je(S.literal,s);if(l.set(y,x),Xe(S))u[x]=S.literal;else{let N=new RegExp("^"+jt(S.literal),"i");N.eager$=!0,f[x]=N}}}else if(S.kind==="regex"){let y=Z(S);if(!i.has(y)){let x=je("rx_"+S.pattern,s);i.set(y,x),f[x]=new RegExp("^"+S.pattern,S.flags)}}if(k.probeHelper){for(let b of k.probeHelper.vocabElements)if(b.kind==="term"){let S=D(b);if(!l.has(S)){let y=je(b.literal,s);if(l.set(S,y),Xe(b))u[y]=b.literal;else{let x=new RegExp("^"+jt(b.literal),"i");x.eager$=!0,f[y]=x}}}else if(b.kind==="regex"){let S=Z(b);if(!i.has(S)){let y=je("rx_"+b.pattern,s);i.set(S,y),f[y]=new RegExp("^"+b.pattern,b.flags)}}}}let a=new Set(e.productions.map(k=>k.name)),{firstSets:c,nullable:o}=Jn(e,l,i),d=new Ge,g={};for(let k of e.productions){if(k.probeHelper){Bn(k,r,g,l,i);continue}if(k.probeDispatch){qn(k,r,g,d,l,i);continue}Dn(k,e,l,i,a,r,g,c,o,d)}let h="__start__";g[h]={open:[{p:t,g:r}],close:[{s:"#ZZ",a:d.register(k=>{k.child&&k.child.node!==void 0&&(k.node=k.child.node)}),g:r}]};let m={fixed:{token:u},rule:{start:h}};return Object.keys(f).length>0&&(m.match={token:f}),{ref:d.map,options:m,rule:g}}function At(e,n,t){let r=[],l={terms:[],ref:null};for(let i of e)if(i.kind==="term")l.terms.push(n.get(D(i)));else if(i.kind==="regex"){let s=Z(i);l.terms.push(t.get(s))}else if(i.kind==="ref")l.ref=i.name,r.push(l),l={terms:[],ref:null};else throw new Error(`bnf: internal \u2014 unexpected element kind '${i.kind}' in emitter`);return(l.terms.length>0||r.length===0)&&r.push(l),r}function Z(e){return`/${e.pattern}/${e.flags}`}function Yn(e){let n=!1;for(let t of e)if(t.kind==="ref"){if(n)return!1;n=!0}else if(t.kind==="term"||t.kind==="regex"){if(n)return!1}else return!1;return!0}function Zn(e,n,t){for(let r of e)if(r.kind==="ref"&&!n.has(r.name))throw new Error(`bnf: rule '${t}' references unknown rule '${r.name}'`)}var Ge=class{constructor(){this.refs={},this.counter=0}register(n){let t=`@bnf_a${this.counter++}`;return this.refs[t]=n,t}get map(){return this.refs}};function ge(e,n){return n==="user"?{rule:e,src:"",kids:[]}:{src:"",kids:[]}}function Pt(e,n,t,r,l,i){let s={g:n};e.terms.length>0&&(s.s=e.terms.join(" ")),e.ref&&(s.p=e.ref);let u=e.terms.length;return(u>0||r)&&(s.a=t.register(f=>{r&&(f.node=ge(l,i));let a=f.node;for(let c=0;c<u;c++)a.src+=f.o[c].src})),s}function Te(e,n,t){return e.register(r=>{r.node==null&&(r.node=ge(n,t));let l=r.node,i=r.child&&r.child.node;if(i!=null){if(typeof i!="object"||!("src"in i)){l.kids.push(i);return}i!==l&&(l.src+=i.src,i.rule?l.kids.push(i):Array.isArray(i.kids)&&l.kids.push(...i.kids))}})}function Dn(e,n,t,r,l,i,s,u,f,a){for(let g of e.alts)Zn(g,l,e.name);if(e.alts.every(Yn)){let g=[...e.alts.filter(k=>k.length>0),...e.alts.filter(k=>k.length===0)],h=g.length>1,m=[];for(let k of g){let S=At(k,t,r)[0],y=k.length>=1&&k.every(N=>N.kind==="ref")&&S.terms.length===0&&S.ref!=null,x=e.nodeKind??"user";if(h&&y){let N=It(k,t,r,u,f);if(N){for(let B of N)m.push({s:B,b:1,p:S.ref,a:a.register(A=>{A.node=ge(e.name,x)}),g:i});continue}}m.push(Pt(S,i,a,!0,e.name,x))}let p={open:m};e.alts.some(k=>k.some(b=>b.kind==="ref"))&&(p.close=[{a:Te(a,e.name,e.nodeKind??"user"),g:i}]),s[e.name]=p;return}if(e.alts.length===1){_t(e.name,e.alts[0],t,r,i,s,a,e.nodeKind??"user");return}let o=[],d=!1;for(let g=0;g<e.alts.length;g++){let h=e.alts[g],m=`${e.name}$alt${g}`;if(h.length===0){d=!0;continue}_t(m,h,t,r,i,s,a,"helper");let p=e.nodeKind??"user",k=a.register(x=>{x.node=ge(e.name,p)}),y=Un(h,n,t,r,4).filter(x=>x.length>0);if(y.length>0)for(let x of y)o.push({s:x.join(" "),b:x.length,p:m,a:k,g:i});else{let x=It(h,t,r,u,f);if(x===null)throw new Error(`bnf: rule '${e.name}' alternative ${g} is nullable but is not the only empty alt; FIRST set is ambiguous`);for(let N of x)o.push({s:N,b:1,p:m,a:k,g:i})}}if(d){let g=e.nodeKind??"user";o.push({a:a.register(h=>{h.node=ge(e.name,g)}),g:i})}s[e.name]={open:o,close:[{a:Te(a,e.name,e.nodeKind??"user"),g:i}]}}function _t(e,n,t,r,l,i,s,u="helper"){let f=At(n,t,r),a=c=>c===0?e:`${e}$step${c}`;for(let c=0;c<f.length;c++){let o=a(c),d=f[c],g=c===0?u:"helper",m={open:[Pt(d,l,s,c===0,o,g)]};c===f.length-1?d.ref&&(m.close=[{a:Te(s,o,g),g:l}]):m.close=[{r:a(c+1),a:Te(s,o,g),g:l}],i[o]=m}}function Jn(e,n,t){let r=new Map,l=new Set;for(let s of e.productions)r.set(s.name,new Set);let i=!0;for(;i;){i=!1;for(let s of e.productions){let u=r.get(s.name);for(let f of s.alts){let a=!0;for(let c of f){if(c.kind==="term"||c.kind==="regex"){let o=c.kind==="term"?n.get(D(c)):t.get(Z(c));u.has(o)||(u.add(o),i=!0),a=!1;break}if(c.kind==="ref"){let o=r.get(c.name)??new Set;for(let d of o)u.has(d)||(u.add(d),i=!0);if(!l.has(c.name)){a=!1;break}continue}throw new Error(`bnf: internal \u2014 unexpected kind in FIRST: ${c.kind}`)}a&&!l.has(s.name)&&(l.add(s.name),i=!0)}}}return{firstSets:r,nullable:l}}function It(e,n,t,r,l){let i=new Set;for(let s of e){if(s.kind==="term"||s.kind==="regex"){let u=s.kind==="term"?n.get(D(s)):t.get(Z(s));return i.add(u),i}if(s.kind==="ref"){let u=r.get(s.name)??new Set;for(let f of u)i.add(f);if(!l.has(s.name))return i;continue}throw new Error(`bnf: internal \u2014 unexpected kind in firstOfAlt: ${s.kind}`)}return null}function Rt(e,n,t,r,l,i=new Set){let s=[{tokens:[],done:!1}];for(let u of e){let f=[];for(let a of s){if(a.done||a.tokens.length>=l){f.push(a);continue}if(u.kind==="term")f.push({tokens:[...a.tokens,t.get(D(u))],done:!1});else if(u.kind==="regex")f.push({tokens:[...a.tokens,r.get(Z(u))],done:!1});else if(u.kind==="ref"){if(i.has(u.name)){f.push({tokens:a.tokens,done:!0});continue}let c=new Set(i);c.add(u.name);let o=n.productions.find(d=>d.name===u.name);if(!o||o.alts.length===0){f.push({tokens:a.tokens,done:!0});continue}for(let d of o.alts){let g=Rt(d,n,t,r,l-a.tokens.length,c);for(let h of g)f.push({tokens:[...a.tokens,...h.tokens],done:h.done})}}else f.push({tokens:a.tokens,done:!0})}if(s=f,s.every(a=>a.done||a.tokens.length>=l))break}return s}function Un(e,n,t,r,l){let i=Rt(e,n,t,r,l),s=new Set,u=[];for(let f of i){let a=f.tokens.join(" ");s.has(a)||(s.add(a),u.push(f.tokens))}return u}function Xe(e){return e.caseSensitive===!0?!0:!/[A-Za-z]/.test(e.literal)}function D(e){return(Xe(e)?"cs:":"ci:")+e.literal}function jt(e){return e.replace(/[\\^$.*+?()[\]{}|]/g,"\\$&")}function Vn(e){let n=e[1].toLowerCase(),t=n==="x"?16:n==="d"?10:2,r=e.slice(2);if(r.includes("-")){let[s,u]=r.split("-"),f=parseInt(s,t),a=parseInt(u,t);if(f===a)return{kind:"term",literal:String.fromCharCode(f)};let c=o=>"\\u"+o.toString(16).padStart(4,"0");return{kind:"regex",pattern:"["+c(f)+"-"+c(a)+"]",flags:""}}return{kind:"term",literal:r.split(".").map(s=>String.fromCharCode(parseInt(s,t))).join("")}}function je(e,n){let t=e.replace(/[^A-Za-z0-9]/g,"_").toUpperCase().replace(/^_+|_+$/g,""),r=t.length>0?"#"+t:"#T";if(!n.has(r))return n.add(r),r;let l=1;for(;n.has(r+l);)l++;let i=r+l;return n.add(i),i}function Gn(e,n){let t=Ct(e);return Nt(t,n)}});var ze=Y((w,He)=>{"use strict";Object.defineProperty(w,"__esModule",{value:!0});w.root=w.S=w.SKIP=w.EMPTY=w.AFTER=w.BEFORE=w.CLOSE=w.OPEN=w.makeTextMatcher=w.makeNumberMatcher=w.makeCommentMatcher=w.makeStringMatcher=w.makeLineMatcher=w.makeSpaceMatcher=w.makeFixedMatcher=w.makeParser=w.makeLex=w.makeRuleSpec=w.makeRule=w.makePoint=w.makeToken=w.util=w.JsonicError=w.Jsonic=void 0;w.make=re;var K=Q();Object.defineProperty(w,"OPEN",{enumerable:!0,get:function(){return K.OPEN}});Object.defineProperty(w,"CLOSE",{enumerable:!0,get:function(){return K.CLOSE}});Object.defineProperty(w,"BEFORE",{enumerable:!0,get:function(){return K.BEFORE}});Object.defineProperty(w,"AFTER",{enumerable:!0,get:function(){return K.AFTER}});Object.defineProperty(w,"EMPTY",{enumerable:!0,get:function(){return K.EMPTY}});Object.defineProperty(w,"SKIP",{enumerable:!0,get:function(){return K.SKIP}});var v=se();Object.defineProperty(w,"S",{enumerable:!0,get:function(){return v.S}});var U=fe();Object.defineProperty(w,"JsonicError",{enumerable:!0,get:function(){return U.JsonicError}});var Xn=pt(),M=ue();Object.defineProperty(w,"makePoint",{enumerable:!0,get:function(){return M.makePoint}});Object.defineProperty(w,"makeToken",{enumerable:!0,get:function(){return M.makeToken}});Object.defineProperty(w,"makeLex",{enumerable:!0,get:function(){return M.makeLex}});Object.defineProperty(w,"makeFixedMatcher",{enumerable:!0,get:function(){return M.makeFixedMatcher}});Object.defineProperty(w,"makeSpaceMatcher",{enumerable:!0,get:function(){return M.makeSpaceMatcher}});Object.defineProperty(w,"makeLineMatcher",{enumerable:!0,get:function(){return M.makeLineMatcher}});Object.defineProperty(w,"makeStringMatcher",{enumerable:!0,get:function(){return M.makeStringMatcher}});Object.defineProperty(w,"makeCommentMatcher",{enumerable:!0,get:function(){return M.makeCommentMatcher}});Object.defineProperty(w,"makeNumberMatcher",{enumerable:!0,get:function(){return M.makeNumberMatcher}});Object.defineProperty(w,"makeTextMatcher",{enumerable:!0,get:function(){return M.makeTextMatcher}});var ie=vt();Object.defineProperty(w,"makeRule",{enumerable:!0,get:function(){return ie.makeRule}});Object.defineProperty(w,"makeRuleSpec",{enumerable:!0,get:function(){return ie.makeRuleSpec}});Object.defineProperty(w,"makeParser",{enumerable:!0,get:function(){return ie.makeParser}});var Lt=Ot(),Kt=$t(),We={tokenize:v.tokenize,srcfmt:v.srcfmt,clone:v.clone,charset:v.charset,trimstk:U.trimstk,makelog:v.makelog,badlex:v.badlex,errsite:U.errsite,errinject:U.errinject,errdesc:U.errdesc,configure:v.configure,parserwrap:v.parserwrap,mesc:v.mesc,escre:v.escre,regexp:v.regexp,prop:U.prop,str:v.str,clean:v.clean,errmsg:U.errmsg,strinject:U.strinject,deep:v.deep,omap:v.omap,keys:v.keys,values:v.values,entries:v.entries};w.util=We;function re(e,n){let t=!0;if(e==="jsonic")t=!1;else if(e==="json")return(0,Lt.makeJSON)(_);e=typeof e=="string"?{}:e;let r={parser:null,config:null,plugins:[],sub:{lex:void 0,rule:void 0},mark:Math.random()},l=(0,v.deep)({},n?{...n.options}:e?.defaults$===!1?{}:Xn.defaults,e||{}),i=function(c,o,d){if(v.S.string===typeof c){let g=i.internal();return(s.parser?.start?(0,v.parserwrap)(s.parser):g.parser).start(c,i,o,d)}return c},s=a=>{if(a!=null){if(v.S.string===typeof a){let c=re()(a);a=c!=null&&v.S.object===typeof c?c:void 0}if(a!=null&&v.S.object===typeof a){(0,v.deep)(l,a),(0,v.configure)(i,r.config,l);let c=i.internal().parser;r.parser=c.clone(l,r.config,i)}}return{...i.options}},u={token:a=>r.config.fixed.token[a]??(0,v.tokenize)(a,r.config,i),tokenSet:a=>(0,v.findTokenSet)(a,r.config),fixed:a=>r.config.fixed.ref[a],options:(0,v.deep)(s,l),config:()=>(0,v.deep)(r.config),parse:i,use:function(c,o){if(v.S.function!==typeof c)throw new Error("Jsonic.use: the first argument must be a function defining a plugin. See https://jsonic.senecajs.org/plugin");let d=c.name.toLowerCase(),g=(0,v.deep)({},c.defaults||{},o||{});i.options({plugin:{[d]:g}});let h=i.options.plugin[d];return i.internal().plugins.push(c),c.options=h,c(i,h)||i},rule:(a,c)=>i.internal().parser.rule(a,c)||i,make:a=>re(a,i),empty:a=>re({defaults$:!1,standard$:!1,grammar$:!1,...a||{}}),id:"Jsonic/"+Date.now()+"/"+(""+Math.random()).substring(2,8).padEnd(6,"0")+(s.tag==null?"":"/"+s.tag),toString:()=>u.id,sub:a=>(a.lex&&(r.sub.lex=r.sub.lex||[],r.sub.lex.push(a.lex)),a.rule&&(r.sub.rule=r.sub.rule||[],r.sub.rule.push(a.rule)),i),util:We,grammar:(a,c)=>{if(typeof a=="string"){let h=re()(a);if(h==null||typeof h!="object")return;a=h}let o=c?.rule?.alt?.g,d=o==null?null:Array.isArray(o)?[...o]:String(o).split(/\s*,\s*/).filter(h=>h.length>0),g=h=>d==null||d.length===0||!Array.isArray(h)?h:h.map(m=>{if(m==null||typeof m!="object")return m;let p=m.g==null?[]:Array.isArray(m.g)?[...m.g]:String(m.g).split(/\s*,\s*/).filter(k=>k.length>0);return{...m,g:[...p,...d]}});if(a.options){let h=(0,v.resolveFuncRefs)(a.options,a.ref);f.options(h)}if(a.rule)for(let h of Object.keys(a.rule)){let m=a.rule[h];f.rule(h,p=>{if(a.ref&&p.fnref(a.ref),m.open){let k=Array.isArray(m.open),b=k?m.open:m.open.alts,S=k?{}:m.open.inject;p.open(g(b),S)}if(m.close){let k=Array.isArray(m.close),b=k?m.close:m.close.alts,S=k?{}:m.close.inject;p.close(g(b),S)}})}},bnf:(()=>{let a=(c,o)=>{let d=(0,Kt.bnf)(c,o);return f.grammar(d),d};return a.toSpec=(c,o)=>(0,Kt.bnf)(c,o),a})()};(0,v.defprop)(u.make,v.S.name,{value:v.S.make});let f=i;if(t?(0,v.assign)(i,u):((0,v.assign)(i,{empty:u.empty,parse:u.parse,sub:u.sub,id:u.id,toString:u.toString}),f=(0,v.assign)(Object.create(i),u)),(0,v.defprop)(i,"internal",{value:()=>r}),n){for(let c in n)i[c]===void 0&&(i[c]=n[c]);i.parent=n;let a=n.internal();r.config=(0,v.deep)({},a.config),(0,v.configure)(i,r.config,l),(0,v.assign)(i.token,r.config.t),r.plugins=[...a.plugins],r.parser=a.parser.clone(l,r.config,f)}else{let a={...i,...u};r.config=(0,v.configure)(a,void 0,l),r.plugins=[],r.parser=(0,ie.makeParser)(l,r.config,f),l.grammar$!==!1&&(0,Lt.grammar)(a)}return i}var _;w.root=_;var Qe=w.root=_=re("jsonic");w.Jsonic=Qe;_.Jsonic=_;_.JsonicError=U.JsonicError;_.makeLex=M.makeLex;_.makeParser=ie.makeParser;_.makeToken=M.makeToken;_.makePoint=M.makePoint;_.makeRule=ie.makeRule;_.makeRuleSpec=ie.makeRuleSpec;_.makeFixedMatcher=M.makeFixedMatcher;_.makeSpaceMatcher=M.makeSpaceMatcher;_.makeLineMatcher=M.makeLineMatcher;_.makeStringMatcher=M.makeStringMatcher;_.makeCommentMatcher=M.makeCommentMatcher;_.makeNumberMatcher=M.makeNumberMatcher;_.makeTextMatcher=M.makeTextMatcher;_.OPEN=K.OPEN;_.CLOSE=K.CLOSE;_.BEFORE=K.BEFORE;_.AFTER=K.AFTER;_.EMPTY=K.EMPTY;_.SKIP=K.SKIP;_.util=We;_.make=re;_.S=v.S;w.default=Qe;typeof He<"u"&&(He.exports=Qe)});var{Jsonic:zn}=ze(),Hn=e=>{try{let n=zn(e);if(n instanceof Error)throw n;return JSON.stringify(n)}catch(n){throw n}};module.exports=Hn;
+`,Ie=null;function Pn(){if(Ie)return Ie;let n=Mt()(An);for(let t of n)t.nodeKind="core";return Ie=new Map(n.map(t=>[t.name,t])),Ie}function Ve(e,n){for(let t of e)if(t.kind==="ref")n.add(t.name);else if(t.kind==="opt"||t.kind==="star"||t.kind==="plus"||t.kind==="rep")Ve([t.inner],n);else if(t.kind==="group")for(let r of t.alts)Ve(r,n)}function Rn(e){let n=Pn(),t=new Set(e.map(u=>u.name)),r=new Set,l=u=>{for(let f of u)for(let a of f.alts)Ve(a,r)};l(e);let i=[],s=!0;for(;s;){s=!1;for(let[u,f]of n)t.has(u)||r.has(u)&&(t.add(u),i.push(f),l([f]),s=!0)}return[...e,...i]}function $n(e){let n=[],t=new Map;for(let r of e){if(r.incremental){let i=t.get(r.name);if(!i)throw new oe(`bnf: '${r.name} =/ \u2026' has no earlier '${r.name} = \u2026' to extend`);i.alts.push(...r.alts);continue}let l={name:r.name,alts:r.alts};r.nodeKind&&(l.nodeKind=r.nodeKind),n.push(l),t.set(r.name,l)}return n}function Ln(e){if(e.kind!=="opt")return null;let n=e.inner;if(n.kind!=="group"||n.alts.length!==1)return null;let t=n.alts[0];if(t.length<2)return null;let r=t[t.length-1];return r.kind!=="term"&&r.kind!=="regex"?null:{xSeq:t.slice(0,-1),disambiguator:r}}function Me(e,n,t,r){if(e.kind==="term"){let l=D(e);t.has(l)||t.set(l,e);return}if(e.kind==="regex"){let l=Z(e);t.has(l)||t.set(l,e);return}if(e.kind==="ref"){if(r.has(e.name))return;r.add(e.name);let l=n.productions.find(i=>i.name===e.name);if(!l)return;for(let i of l.alts)for(let s of i)Me(s,n,t,r);return}if(e.kind==="opt"||e.kind==="star"||e.kind==="plus"||e.kind==="rep"){Me(e.inner,n,t,r);return}if(e.kind==="group"){for(let l of e.alts)for(let i of l)Me(i,n,t,r);return}}function Et(e,n){let t=new Map,r=new Set;for(let l of e)Me(l,n,t,r);return t}function Kn(e,n){for(let t of e.keys())if(n.has(t))return!0;return!1}function Fn(e){let n=e.ambiguities??[],t=[],r=new Set(e.productions.map(s=>s.name));function l(s){let u=s,f=1;for(;r.has(u);)u=s+f,f++;return r.add(u),u}let i=[];for(let s of e.productions){let u=[],f=!1;for(let a=0;a<s.alts.length;a++){let c=s.alts[a],o=[];for(let d=0;d<c.length;d++){let g=c[d],h=Ln(g);if(!h){o.push(g);continue}let m=c.slice(d+1);if(m.length===0){o.push(g);continue}let p=Et(h.xSeq,e),k=Et(m,e);if(!Kn(p,k)){o.push(g);continue}let b=new Map([...p,...k]),S=h.disambiguator,y=S.kind==="term"?D(S):S.kind==="regex"?Z(S):null;y&&b.delete(y);let x=l(`${s.name}$pd${d}`),N=l(`${x}$probe`),B=l(`${x}$with`),A=l(`${x}$no`);t.push({name:N,alts:[],probeHelper:{vocabElements:[...b.values()]},nodeKind:"helper"}),t.push({name:B,alts:[[...h.xSeq,h.disambiguator,...m]],nodeKind:"helper"}),t.push({name:A,alts:[m],nodeKind:"helper"}),t.push({name:x,alts:[[{kind:"ref",name:B}],[{kind:"ref",name:A}]],probeDispatch:{probeRule:N,disambiguator:h.disambiguator,withBranch:B,noBranch:A},nodeKind:"helper"}),n.push({rule:s.name,altIdx:a,optIdx:d,reason:"optional prefix shares vocabulary with tail",resolved:!0}),o.push({kind:"ref",name:x}),d=c.length,f=!0}u.push(o)}f?i.push({name:s.name,alts:u,nodeKind:s.nodeKind}):i.push(s)}return{productions:[...i,...t],ambiguities:n}}function Bn(e,n,t,r,l){let i=e.probeHelper.vocabElements,s=[];for(let u of i){let f=u.kind==="term"?r.get(D(u)):u.kind==="regex"?l.get(Z(u)):void 0;f&&s.push({s:f,r:e.name,g:n})}s.push({g:n}),t[e.name]={open:s}}function qn(e,n,t,r,l,i){let{probeRule:s,disambiguator:u,withBranch:f,noBranch:a}=e.probeDispatch,c=u.kind==="term"?l.get(D(u)):u.kind==="regex"?i.get(Z(u)):void 0;if(!c)throw new Error(`bnf: probe-dispatch rule '${e.name}' has unresolvable disambiguator (kind=${u.kind})`);let o=r.register((h,m)=>{h.k.pd_phase=0,h.k.pd_mark=m.mark()}),d=r.register((h,m)=>{let p=m.t[0];m.rewind(h.k.pd_mark);let k=p&&p.name===c;h.k.pd_phase=k?1:2}),g=r.register(h=>{h.child&&h.child.node!==void 0&&(h.node=h.child.node)});t[e.name]={open:[{c:r.register(h=>!h.k.pd_phase),a:o,p:s,g:n},{c:r.register(h=>h.k.pd_phase===1),p:f,g:n},{c:r.register(h=>h.k.pd_phase===2),p:a,g:n}],close:[{c:r.register(h=>h.k.pd_phase===0),a:d,r:e.name,g:n},{a:g,g:n}]}}function Nt(e,n){let t=n?.start??e.productions[0].name,r=n?.tag??"bnf";e=Tt(e),e=Fn(e),e=Nn(e);let l=new Map,i=new Map,s=new Set,u={},f={};for(let k of e.productions){for(let b of k.alts)for(let S of b)if(S.kind==="term"){let y=D(S);if(!l.has(y)){let x=je(S.literal,s);if(l.set(y,x),Xe(S))u[x]=S.literal;else{let N=new RegExp("^"+jt(S.literal),"i");N.eager$=!0,f[x]=N}}}else if(S.kind==="regex"){let y=Z(S);if(!i.has(y)){let x=je("rx_"+S.pattern,s);i.set(y,x),f[x]=new RegExp("^"+S.pattern,S.flags)}}if(k.probeHelper){for(let b of k.probeHelper.vocabElements)if(b.kind==="term"){let S=D(b);if(!l.has(S)){let y=je(b.literal,s);if(l.set(S,y),Xe(b))u[y]=b.literal;else{let x=new RegExp("^"+jt(b.literal),"i");x.eager$=!0,f[y]=x}}}else if(b.kind==="regex"){let S=Z(b);if(!i.has(S)){let y=je("rx_"+b.pattern,s);i.set(S,y),f[y]=new RegExp("^"+b.pattern,b.flags)}}}}let a=new Set(e.productions.map(k=>k.name)),{firstSets:c,nullable:o}=Jn(e,l,i),d=new Ge,g={};for(let k of e.productions){if(k.probeHelper){Bn(k,r,g,l,i);continue}if(k.probeDispatch){qn(k,r,g,d,l,i);continue}Dn(k,e,l,i,a,r,g,c,o,d)}let h="__start__";g[h]={open:[{p:t,g:r}],close:[{s:"#ZZ",a:d.register(k=>{k.child&&k.child.node!==void 0&&(k.node=k.child.node)}),g:r}]};let m={fixed:{token:u},rule:{start:h}};return Object.keys(f).length>0&&(m.match={token:f}),{ref:d.map,options:m,rule:g}}function At(e,n,t){let r=[],l={terms:[],ref:null};for(let i of e)if(i.kind==="term")l.terms.push(n.get(D(i)));else if(i.kind==="regex"){let s=Z(i);l.terms.push(t.get(s))}else if(i.kind==="ref")l.ref=i.name,r.push(l),l={terms:[],ref:null};else throw new Error(`bnf: internal \u2014 unexpected element kind '${i.kind}' in emitter`);return(l.terms.length>0||r.length===0)&&r.push(l),r}function Z(e){return`/${e.pattern}/${e.flags}`}function Yn(e){let n=!1;for(let t of e)if(t.kind==="ref"){if(n)return!1;n=!0}else if(t.kind==="term"||t.kind==="regex"){if(n)return!1}else return!1;return!0}function Zn(e,n,t){for(let r of e)if(r.kind==="ref"&&!n.has(r.name))throw new Error(`bnf: rule '${t}' references unknown rule '${r.name}'`)}var Ge=class{constructor(){this.refs={},this.counter=0}register(n){let t=`@bnf_a${this.counter++}`;return this.refs[t]=n,t}get map(){return this.refs}};function ge(e,n){return n==="user"?{rule:e,src:"",kids:[]}:{src:"",kids:[]}}function Pt(e,n,t,r,l,i){let s={g:n};e.terms.length>0&&(s.s=e.terms.join(" ")),e.ref&&(s.p=e.ref);let u=e.terms.length;return(u>0||r)&&(s.a=t.register(f=>{r&&(f.node=ge(l,i));let a=f.node;for(let c=0;c<u;c++)a.src+=f.o[c].src})),s}function Te(e,n,t){return e.register(r=>{r.node==null&&(r.node=ge(n,t));let l=r.node,i=r.child&&r.child.node;if(i!=null){if(typeof i!="object"||!("src"in i)){l.kids.push(i);return}i!==l&&(l.src+=i.src,i.rule?l.kids.push(i):Array.isArray(i.kids)&&l.kids.push(...i.kids))}})}function Dn(e,n,t,r,l,i,s,u,f,a){for(let g of e.alts)Zn(g,l,e.name);if(e.alts.every(Yn)){let g=[...e.alts.filter(k=>k.length>0),...e.alts.filter(k=>k.length===0)],h=g.length>1,m=[];for(let k of g){let S=At(k,t,r)[0],y=k.length>=1&&k.every(N=>N.kind==="ref")&&S.terms.length===0&&S.ref!=null,x=e.nodeKind??"user";if(h&&y){let N=It(k,t,r,u,f);if(N){for(let B of N)m.push({s:B,b:1,p:S.ref,a:a.register(A=>{A.node=ge(e.name,x)}),g:i});continue}}m.push(Pt(S,i,a,!0,e.name,x))}let p={open:m};e.alts.some(k=>k.some(b=>b.kind==="ref"))&&(p.close=[{a:Te(a,e.name,e.nodeKind??"user"),g:i}]),s[e.name]=p;return}if(e.alts.length===1){_t(e.name,e.alts[0],t,r,i,s,a,e.nodeKind??"user");return}let o=[],d=!1;for(let g=0;g<e.alts.length;g++){let h=e.alts[g],m=`${e.name}$alt${g}`;if(h.length===0){d=!0;continue}_t(m,h,t,r,i,s,a,"helper");let p=e.nodeKind??"user",k=a.register(x=>{x.node=ge(e.name,p)}),y=Un(h,n,t,r,4).filter(x=>x.length>0);if(y.length>0)for(let x of y)o.push({s:x.join(" "),b:x.length,p:m,a:k,g:i});else{let x=It(h,t,r,u,f);if(x===null)throw new Error(`bnf: rule '${e.name}' alternative ${g} is nullable but is not the only empty alt; FIRST set is ambiguous`);for(let N of x)o.push({s:N,b:1,p:m,a:k,g:i})}}if(d){let g=e.nodeKind??"user";o.push({a:a.register(h=>{h.node=ge(e.name,g)}),g:i})}s[e.name]={open:o,close:[{a:Te(a,e.name,e.nodeKind??"user"),g:i}]}}function _t(e,n,t,r,l,i,s,u="helper"){let f=At(n,t,r),a=c=>c===0?e:`${e}$step${c}`;for(let c=0;c<f.length;c++){let o=a(c),d=f[c],g=c===0?u:"helper",m={open:[Pt(d,l,s,c===0,o,g)]};c===f.length-1?d.ref&&(m.close=[{a:Te(s,o,g),g:l}]):m.close=[{r:a(c+1),a:Te(s,o,g),g:l}],i[o]=m}}function Jn(e,n,t){let r=new Map,l=new Set;for(let s of e.productions)r.set(s.name,new Set);let i=!0;for(;i;){i=!1;for(let s of e.productions){let u=r.get(s.name);for(let f of s.alts){let a=!0;for(let c of f){if(c.kind==="term"||c.kind==="regex"){let o=c.kind==="term"?n.get(D(c)):t.get(Z(c));u.has(o)||(u.add(o),i=!0),a=!1;break}if(c.kind==="ref"){let o=r.get(c.name)??new Set;for(let d of o)u.has(d)||(u.add(d),i=!0);if(!l.has(c.name)){a=!1;break}continue}throw new Error(`bnf: internal \u2014 unexpected kind in FIRST: ${c.kind}`)}a&&!l.has(s.name)&&(l.add(s.name),i=!0)}}}return{firstSets:r,nullable:l}}function It(e,n,t,r,l){let i=new Set;for(let s of e){if(s.kind==="term"||s.kind==="regex"){let u=s.kind==="term"?n.get(D(s)):t.get(Z(s));return i.add(u),i}if(s.kind==="ref"){let u=r.get(s.name)??new Set;for(let f of u)i.add(f);if(!l.has(s.name))return i;continue}throw new Error(`bnf: internal \u2014 unexpected kind in firstOfAlt: ${s.kind}`)}return null}function Rt(e,n,t,r,l,i=new Set){let s=[{tokens:[],done:!1}];for(let u of e){let f=[];for(let a of s){if(a.done||a.tokens.length>=l){f.push(a);continue}if(u.kind==="term")f.push({tokens:[...a.tokens,t.get(D(u))],done:!1});else if(u.kind==="regex")f.push({tokens:[...a.tokens,r.get(Z(u))],done:!1});else if(u.kind==="ref"){if(i.has(u.name)){f.push({tokens:a.tokens,done:!0});continue}let c=new Set(i);c.add(u.name);let o=n.productions.find(d=>d.name===u.name);if(!o||o.alts.length===0){f.push({tokens:a.tokens,done:!0});continue}for(let d of o.alts){let g=Rt(d,n,t,r,l-a.tokens.length,c);for(let h of g)f.push({tokens:[...a.tokens,...h.tokens],done:h.done})}}else f.push({tokens:a.tokens,done:!0})}if(s=f,s.every(a=>a.done||a.tokens.length>=l))break}return s}function Un(e,n,t,r,l){let i=Rt(e,n,t,r,l),s=new Set,u=[];for(let f of i){let a=f.tokens.join(" ");s.has(a)||(s.add(a),u.push(f.tokens))}return u}function Xe(e){return e.caseSensitive===!0?!0:!/[A-Za-z]/.test(e.literal)}function D(e){return(Xe(e)?"cs:":"ci:")+e.literal}function jt(e){return e.replace(/[\\^$.*+?()[\]{}|]/g,"\\$&")}function Vn(e){let n=e[1].toLowerCase(),t=n==="x"?16:n==="d"?10:2,r=e.slice(2);if(r.includes("-")){let[s,u]=r.split("-"),f=parseInt(s,t),a=parseInt(u,t);if(f===a)return{kind:"term",literal:String.fromCharCode(f)};let c=o=>"\\u"+o.toString(16).padStart(4,"0");return{kind:"regex",pattern:"["+c(f)+"-"+c(a)+"]",flags:""}}return{kind:"term",literal:r.split(".").map(s=>String.fromCharCode(parseInt(s,t))).join("")}}function je(e,n){let t=e.replace(/[^A-Za-z0-9]/g,"_").toUpperCase().replace(/^_+|_+$/g,""),r=t.length>0?"#"+t:"#T";if(!n.has(r))return n.add(r),r;let l=1;for(;n.has(r+l);)l++;let i=r+l;return n.add(i),i}function Gn(e,n){let t=Ct(e);return Nt(t,n)}});var ze=Y((w,He)=>{"use strict";Object.defineProperty(w,"__esModule",{value:!0});w.root=w.S=w.SKIP=w.EMPTY=w.AFTER=w.BEFORE=w.CLOSE=w.OPEN=w.makeTextMatcher=w.makeNumberMatcher=w.makeCommentMatcher=w.makeStringMatcher=w.makeLineMatcher=w.makeSpaceMatcher=w.makeFixedMatcher=w.makeParser=w.makeLex=w.makeRuleSpec=w.makeRule=w.makePoint=w.makeToken=w.util=w.JsonicError=w.Jsonic=void 0;w.make=re;var K=Q();Object.defineProperty(w,"OPEN",{enumerable:!0,get:function(){return K.OPEN}});Object.defineProperty(w,"CLOSE",{enumerable:!0,get:function(){return K.CLOSE}});Object.defineProperty(w,"BEFORE",{enumerable:!0,get:function(){return K.BEFORE}});Object.defineProperty(w,"AFTER",{enumerable:!0,get:function(){return K.AFTER}});Object.defineProperty(w,"EMPTY",{enumerable:!0,get:function(){return K.EMPTY}});Object.defineProperty(w,"SKIP",{enumerable:!0,get:function(){return K.SKIP}});var v=se();Object.defineProperty(w,"S",{enumerable:!0,get:function(){return v.S}});var U=fe();Object.defineProperty(w,"JsonicError",{enumerable:!0,get:function(){return U.JsonicError}});var Xn=pt(),M=ue();Object.defineProperty(w,"makePoint",{enumerable:!0,get:function(){return M.makePoint}});Object.defineProperty(w,"makeToken",{enumerable:!0,get:function(){return M.makeToken}});Object.defineProperty(w,"makeLex",{enumerable:!0,get:function(){return M.makeLex}});Object.defineProperty(w,"makeFixedMatcher",{enumerable:!0,get:function(){return M.makeFixedMatcher}});Object.defineProperty(w,"makeSpaceMatcher",{enumerable:!0,get:function(){return M.makeSpaceMatcher}});Object.defineProperty(w,"makeLineMatcher",{enumerable:!0,get:function(){return M.makeLineMatcher}});Object.defineProperty(w,"makeStringMatcher",{enumerable:!0,get:function(){return M.makeStringMatcher}});Object.defineProperty(w,"makeCommentMatcher",{enumerable:!0,get:function(){return M.makeCommentMatcher}});Object.defineProperty(w,"makeNumberMatcher",{enumerable:!0,get:function(){return M.makeNumberMatcher}});Object.defineProperty(w,"makeTextMatcher",{enumerable:!0,get:function(){return M.makeTextMatcher}});var ie=vt();Object.defineProperty(w,"makeRule",{enumerable:!0,get:function(){return ie.makeRule}});Object.defineProperty(w,"makeRuleSpec",{enumerable:!0,get:function(){return ie.makeRuleSpec}});Object.defineProperty(w,"makeParser",{enumerable:!0,get:function(){return ie.makeParser}});var Lt=Ot(),Kt=$t(),We={tokenize:v.tokenize,srcfmt:v.srcfmt,clone:v.clone,charset:v.charset,trimstk:U.trimstk,makelog:v.makelog,badlex:v.badlex,errsite:U.errsite,errinject:U.errinject,errdesc:U.errdesc,configure:v.configure,parserwrap:v.parserwrap,mesc:v.mesc,escre:v.escre,regexp:v.regexp,prop:U.prop,str:v.str,clean:v.clean,errmsg:U.errmsg,strinject:U.strinject,deep:v.deep,omap:v.omap,keys:v.keys,values:v.values,entries:v.entries};w.util=We;function re(e,n){let t=!0;if(e==="jsonic")t=!1;else if(e==="json")return(0,Lt.makeJSON)(_);e=typeof e=="string"?{}:e;let r={parser:null,config:null,plugins:[],sub:{lex:void 0,rule:void 0},mark:Math.random()},l=(0,v.deep)({},n?{...n.options}:e?.defaults$===!1?{}:Xn.defaults,e||{}),i=function(c,o,d){if(v.S.string===typeof c){let g=i.internal();return(s.parser?.start?(0,v.parserwrap)(s.parser):g.parser).start(c,i,o,d)}return c},s=a=>{if(a!=null){if(v.S.string===typeof a){let c=re()(a);a=c!=null&&v.S.object===typeof c?c:void 0}if(a!=null&&v.S.object===typeof a){(0,v.deep)(l,a),(0,v.configure)(i,r.config,l);let c=i.internal().parser;r.parser=c.clone(l,r.config,i)}}return{...i.options}},u={token:a=>r.config.fixed.token[a]??(0,v.tokenize)(a,r.config,i),tokenSet:a=>(0,v.findTokenSet)(a,r.config),fixed:a=>r.config.fixed.ref[a],options:(0,v.deep)(s,l),config:()=>(0,v.deep)(r.config),parse:i,use:function(c,o){if(v.S.function!==typeof c)throw new Error("Jsonic.use: the first argument must be a function defining a plugin. See https://jsonic.senecajs.org/plugin");let d=c.name.toLowerCase(),g=(0,v.deep)({},c.defaults||{},o||{});i.options({plugin:{[d]:g}});let h=i.options.plugin[d];return i.internal().plugins.push(c),c.options=h,c(i,h)||i},rule:(a,c)=>i.internal().parser.rule(a,c)||i,make:a=>re(a,i),empty:a=>re({defaults$:!1,standard$:!1,grammar$:!1,...a||{}}),id:"Jsonic/"+Date.now()+"/"+(""+Math.random()).substring(2,8).padEnd(6,"0")+(s.tag==null?"":"/"+s.tag),toString:()=>u.id,sub:a=>(a.lex&&(r.sub.lex=r.sub.lex||[],r.sub.lex.push(a.lex)),a.rule&&(r.sub.rule=r.sub.rule||[],r.sub.rule.push(a.rule)),i),util:We,grammar:(a,c)=>{if(typeof a=="string"){let h=re()(a);if(h==null||typeof h!="object")return;a=h}let o=c?.rule?.alt?.g,d=o==null?null:Array.isArray(o)?[...o]:String(o).split(/\s*,\s*/).filter(h=>h.length>0),g=h=>d==null||d.length===0||!Array.isArray(h)?h:h.map(m=>{if(m==null||typeof m!="object")return m;let p=m.g==null?[]:Array.isArray(m.g)?[...m.g]:String(m.g).split(/\s*,\s*/).filter(k=>k.length>0);return{...m,g:[...p,...d]}});if(a.options){let h=(0,v.resolveFuncRefs)(a.options,a.ref);f.options(h)}if(a.rule)for(let h of Object.keys(a.rule)){let m=a.rule[h];f.rule(h,p=>{if(a.ref&&p.fnref(a.ref),m.open){let k=Array.isArray(m.open),b=k?m.open:m.open.alts,S=k?{}:m.open.inject;p.open(g(b),S)}if(m.close){let k=Array.isArray(m.close),b=k?m.close:m.close.alts,S=k?{}:m.close.inject;p.close(g(b),S)}})}},bnf:(()=>{let a=(c,o)=>{let d=(0,Kt.bnf)(c,o);return f.grammar(d),d};return a.toSpec=(c,o)=>(0,Kt.bnf)(c,o),a})()};(0,v.defprop)(u.make,v.S.name,{value:v.S.make});let f=i;if(t?(0,v.assign)(i,u):((0,v.assign)(i,{empty:u.empty,parse:u.parse,sub:u.sub,id:u.id,toString:u.toString}),f=(0,v.assign)(Object.create(i),u)),(0,v.defprop)(i,"internal",{value:()=>r}),n){for(let c in n)i[c]===void 0&&(i[c]=n[c]);i.parent=n;let a=n.internal();r.config=(0,v.deep)({},a.config),(0,v.configure)(i,r.config,l),(0,v.assign)(i.token,r.config.t),r.plugins=[...a.plugins],r.parser=a.parser.clone(l,r.config,f)}else{let a={...i,...u};r.config=(0,v.configure)(a,void 0,l),r.plugins=[],r.parser=(0,ie.makeParser)(l,r.config,f),l.grammar$!==!1&&(0,Lt.grammar)(a)}return i}var _;w.root=_;var Qe=w.root=_=re("jsonic");w.Jsonic=Qe;_.Jsonic=_;_.JsonicError=U.JsonicError;_.makeLex=M.makeLex;_.makeParser=ie.makeParser;_.makeToken=M.makeToken;_.makePoint=M.makePoint;_.makeRule=ie.makeRule;_.makeRuleSpec=ie.makeRuleSpec;_.makeFixedMatcher=M.makeFixedMatcher;_.makeSpaceMatcher=M.makeSpaceMatcher;_.makeLineMatcher=M.makeLineMatcher;_.makeStringMatcher=M.makeStringMatcher;_.makeCommentMatcher=M.makeCommentMatcher;_.makeNumberMatcher=M.makeNumberMatcher;_.makeTextMatcher=M.makeTextMatcher;_.OPEN=K.OPEN;_.CLOSE=K.CLOSE;_.BEFORE=K.BEFORE;_.AFTER=K.AFTER;_.EMPTY=K.EMPTY;_.SKIP=K.SKIP;_.util=We;_.make=re;_.S=v.S;w.default=Qe;typeof He<"u"&&(He.exports=Qe)});var{Jsonic:zn}=ze(),Sp={lenient:null,strict:{number:{hex:!1,oct:!1,bin:!1,sep:null},rule:{exclude:"path"}}},Sd="lenient",Sm=new Map,Sg=e=>{let n=e??Sd,t=Sm.get(n);if(t===void 0){let r;if(Object.prototype.hasOwnProperty.call(Sp,n))r=Sp[n];else if(n.startsWith("{"))r=JSON.parse(n);else throw new Error(`salvajson: unknown repair profile: ${n}`);t=r===null?zn:zn.make(r),Sm.set(n,t)}return t},Hn=(e,n)=>{try{let t=Sg(n)(e);if(t instanceof Error)throw t;return JSON.stringify(t)}catch(t){throw t}};module.exports=Hn;
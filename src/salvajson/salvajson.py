@@ -11,24 +11,44 @@ from pythonmonkey import require  # type: ignore
 # Define a type alias for the complex return type of loads
 JSONSerializable = dict[str, Any] | list[Any] | int | float | str | None
 
+# A repair profile is either a named preset ("lenient", "strict") or a dict of
+# Jsonic.make() options; see PROFILES in js_src/salvajson.src.js.
+Profile = str | dict[str, Any]
+
 _SALVAJSON_DIR: Final[Path] = Path(__file__).parent.absolute()
 _salvajson_js: typing.Any = require(str(_SALVAJSON_DIR / "salvajson.js"))  # type: ignore[no-untyped-call]
 
 
-def salvaj(json_str: str) -> str:
+def _profile_key(profile: Profile) -> str:
+    """Convert a repair profile into the key used by the JS parser cache.
+
+    Custom option dicts are serialized with sorted keys so that equal dicts
+    share one configured Jsonic instance.
+    """
+    if isinstance(profile, dict):
+        return orjson.dumps(profile, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return profile
+
+
+def salvaj(json_str: str, profile: Profile = "lenient") -> str:
     """Re-parse potentially corrupted JSON string using jsonic.
 
     Args:
         json_str: The JSON string to parse
+        profile: Repair profile: "lenient" (stock jsonic, every leniency
+            feature on), "strict" (no hex/octal/binary or "_"-separated
+            numbers, no path-dive keys), or a dict of Jsonic.make() options.
+            The configured parser is built once and cached on the JS side.
 
     Returns:
         Fixed JSON string that can be parsed by standard JSON parsers
 
     Raises:
-        pythonmonkey.SpiderMonkeyError: If jsonic fails to parse/fix the string.
+        pythonmonkey.SpiderMonkeyError: If jsonic fails to parse/fix the string,
+            or if the profile name is unknown.
     """
     # Cast the result of the dynamic call, as we expect the JS to return a string.
-    return cast(str, _salvajson_js(json_str))
+    return cast(str, _salvajson_js(json_str, _profile_key(profile)))
 
 
 def dumps(
@@ -83,6 +103,7 @@ def loads(
     parse_int: Callable | None = None,
     parse_constant: Callable | None = None,
     object_pairs_hook: Callable | None = None,
+    profile: Profile = "lenient",
     **kw: typing.Any,  # Use typing.Any directly
 ) -> JSONSerializable:
     """Parse JSON string into Python object, with fallback to jsonic parser.
@@ -95,6 +116,7 @@ def loads(
         parse_int: Ignored, for compatibility with json.loads()
         parse_constant: Ignored, for compatibility with json.loads()
         object_pairs_hook: Ignored, for compatibility with json.loads()
+        profile: Repair profile passed to salvaj() on fallback
         **kw: Additional keyword arguments ignored for compatibility
 
     Returns:
@@ -109,4 +131,4 @@ def loads(
         return cast(JSONSerializable, orjson.loads(s))
     except orjson.JSONDecodeError:
         str_input: str = s.decode("utf-8") if isinstance(s, bytes) else s
-        return cast(JSONSerializable, orjson.loads(str(salvaj(str_input))))
+        return cast(JSONSerializable, orjson.loads(str(salvaj(str_input, profile))))
@@ -73,6 +73,36 @@ def test_salvaj_error_cases(invalid_json: str):
     assert "[jsonic/" in error_message or "SyntaxError:" in error_message
 
 
+@pytest.mark.parametrize("corrupted,expected", CORRUPTED_CASES)  # noqa: PT006
+def test_salvaj_strict_profile_repairs(corrupted: str, expected: str):
+    """Test that the strict profile still fixes the common corruptions."""
+    result = salvaj(corrupted, profile="strict")
+    assert json.loads(result) == json.loads(expected)
+
+
+def test_salvaj_profiles_number_formats():
+    """Test that only the lenient profile parses exotic number formats."""
+    assert json.loads(salvaj("{a: 0x10}")) == {"a": 16}
+    assert json.loads(salvaj("{a: 0x10}", profile="lenient")) == {"a": 16}
+    assert json.loads(salvaj("{a: 0x10}", profile="strict")) == {"a": "0x10"}
+
+
+def test_salvaj_custom_profile():
+    """Test passing a dict of Jsonic.make() options as the profile."""
+    profile = {"number": {"sep": None}}
+    assert json.loads(salvaj("{a: 1_000}")) == {"a": 1000}
+    assert json.loads(salvaj("{a: 1_000}", profile=profile)) == {"a": "1_000"}
+    # Second call reuses the cached parser and must behave identically
+    assert json.loads(salvaj("{a: 1_000}", profile=profile)) == {"a": "1_000"}
+
+
+def test_salvaj_unknown_profile():
+    """Test that an unknown profile name raises an error."""
+    with pytest.raises(SpiderMonkeyError) as excinfo:
+        salvaj(VALID_JSON, profile="nonexistent")
+    assert "unknown repair profile" in str(excinfo.value)
+
+
 def test_cli_with_file(tmp_path: Path):
     """Test CLI functionality with a file input."""
     # Create a test file
@@ -236,6 +266,14 @@ def test_loads_corrupted_json_fallback():
     assert loads(corrupted_json_bytes) == expected_data_after_salvaj
 
 
+def test_loads_profile_fallback():
+    """Test that loads passes the repair profile to salvaj on fallback."""
+    assert loads("{a: 0x10}") == {"a": 16}
+    assert loads("{a: 0x10}", profile="strict") == {"a": "0x10"}
+    # Valid JSON never reaches the repair path
+    assert loads('{"a": 16}', profile="strict") == {"a": 16}
+
+
 def test_loads_error_case_after_fallback():
     """Test loads with JSON so corrupted that even salvaj fails."""
     # This JSON is one of the ERROR_CASES